@@ -53,13 +53,18 @@ class Ensemble:
             if len(cur_dict) == 0:
                 return update_dict
 
+            # Index cur_dict by the id of its values so each key in update_dict is a
+            # single lookup instead of a scan over cur_dict
+            cur_ids_by_node = {}
+            for cur_id, cur_node in cur_dict.items():
+                cur_ids_by_node.setdefault(id(cur_node), []).append(cur_id)
+
             # Merge values from update_dict into keys from cur_dict
-            seen_keys = []
+            seen_keys = set()
             for new_id, new_node in update_dict.items():
-                for cur_id, cur_node in cur_dict.items():
-                    if id(cur_node) == new_id:
-                        merged_dict[cur_id] = new_node
-                        seen_keys.append(new_id)
+                for cur_id in cur_ids_by_node.get(new_id, ()):
+                    merged_dict[cur_id] = new_node
+                    seen_keys.add(new_id)
 
             # Pairs that are left in update_dict
             for tid, node in update_dict.items():
@@ -82,13 +87,14 @@ class Ensemble:
             for i in range(len(thickets)):
                 thickets[i].graph = union_graph
                 idx_names = thickets[i].dataframe.index.names
-                thickets[i].dataframe = thickets[i].dataframe.reset_index()
+                # Build the replacements once per unique node, not once per row
                 replace_dict = {}
-                for node in thickets[i].dataframe["node"]:
+                for node in thickets[i].dataframe.index.unique(level="node"):
                     node_id = id(node)
                     if node_id in old_to_new:
                         check_same_frame(node, old_to_new[node_id])
                         replace_dict[node] = old_to_new[node_id]
+                thickets[i].dataframe = thickets[i].dataframe.reset_index()
                 thickets[i].dataframe["node"] = (
                     thickets[i].dataframe["node"].replace(replace_dict)
                 )
@@ -317,9 +323,10 @@ class Ensemble:
             )
 
             # Extract "name" columns to upper level
-            nodes = list(set(combined_th.dataframe.reset_index()["node"]))
-            for node in nodes:
-                combined_th.dataframe.loc[node, "name"] = node.frame["name"]
+            combined_th.dataframe["name"] = [
+                n.frame["name"]
+                for n in combined_th.dataframe.index.get_level_values("node")
+            ]
             combined_th.dataframe.drop(
                 columns=[(headers[i], "name") for i in range(len(headers))],
                 inplace=True,
@@ -1,3 +1,4 @@
+from operator import attrgetter
 import warnings
 
 import numpy as np
@@ -132,7 +133,9 @@ class ThicketRenderer(ConsoleRenderer):
         else:
             self.lr_arrows = {"◀": "< ", "▶": "> "}
 
-        for root in sorted(roots, key=lambda n: n.frame):
+        # Nodes already rendered; a set keeps the revisit check constant-time
+        self.visited = set()
+        for root in sorted(roots, key=attrgetter("frame")):
             result += self.render_frame(root, dataframe)
 
         if self.color is True:
@@ -289,8 +292,8 @@ class ThicketRenderer(ConsoleRenderer):
             # ensures that we never revisit nodes in the case of
             # large complex graphs
             if node not in self.visited:
-                self.visited.append(node)
-                sorted_children = sorted(node.children, key=lambda n: n.frame)
+                self.visited.add(node)
+                sorted_children = sorted(node.children, key=attrgetter("frame"))
                 if sorted_children:
                     last_child = sorted_children[-1]
 
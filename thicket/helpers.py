@@ -11,15 +11,8 @@ def _are_synced(gh, df):
     """Check if node objects are equal in graph and dataframe id(graph_node) ==
     id(df_node).
     """
-    for graph_node in gh.traverse():
-        node_present = False
-        for df_node in df.index.get_level_values("node"):
-            if id(df_node) == id(graph_node):
-                node_present = True
-                continue
-        if not node_present:
-            return False
-    return True
+    df_node_ids = {id(df_node) for df_node in df.index.get_level_values("node")}
+    return all(id(graph_node) in df_node_ids for graph_node in gh.traverse())
 
 
 def _missing_nodes_to_list(a_df, b_df):
@@ -77,7 +70,7 @@ def _new_statsframe_df(df, multiindex=False):
     Returns:
         (DataFrame): new aggregated statistics table
     """
-    nodes = list(set(df.reset_index()["node"]))  # List of nodes
+    nodes = df.index.unique(level="node").tolist()  # List of nodes
     names = [node.frame["name"] for node in nodes]  # List of names
 
     # Create new dataframe with "node" index and "name" data by default.
@@ -29,6 +29,9 @@ class ModelWrapper:
     the model.
     """
 
+    # One wrapper is stored per node and metric in the statsframe
+    __slots__ = ("mdl", "param_name")
+
     def __init__(self, mdl, param_name):
         self.mdl = mdl
         self.param_name = param_name  # Needed for plotting / displaying the model
@@ -12,6 +12,7 @@ import hatchet as ht
 
 from thicket import Thicket
 import thicket.helpers as helpers
+from thicket.utils import InvalidNameError, validate_dataframe
 
 
 def test_invalid_constructor():
@@ -19,6 +20,14 @@ def test_invalid_constructor():
         Thicket(None, None)
 
 
+def test_eq(mpi_scaling_cali):
+    tk = Thicket.from_caliperreader(mpi_scaling_cali[0], disable_tqdm=True)
+
+    assert tk == tk
+    assert tk == tk.deepcopy()
+    assert tk != "not a thicket"
+
+
 def test_resolve_missing_indicies():
     names_0 = ["node", "profile", "rank"]
     names_1 = ["node", "profile"]
@@ -47,6 +56,24 @@ def test_resolve_missing_indicies():
     assert set(names_1).issubset(th_1.dataframe.index.names)
 
 
+def test_validate_name_column():
+    node_0 = ht.node.Node(ht.frame.Frame({"name": "foo", "type": "function"}), hnid=0)
+    node_1 = ht.node.Node(ht.frame.Frame({"name": "bar", "type": "function"}), hnid=1)
+    df = pd.DataFrame(
+        data={"time": np.random.randn(4), "name": ["foo", None, "bar", "bar"]},
+        index=pd.MultiIndex.from_product(
+            [[node_0, node_1], ["A", "B"]], names=["node", "profile"]
+        ),
+    )
+
+    # None is allowed in place of the node's name
+    validate_dataframe(df)
+
+    df.loc[(node_1, "B"), "name"] = "foo"
+    with pytest.raises(InvalidNameError):
+        validate_dataframe(df)
+
+
 def test_statsframe(rajaperf_seq_O3_1M_cali):
     def _test_multiindex():
         """Test statsframe when headers are multiindexed."""
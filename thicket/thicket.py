@@ -101,7 +101,10 @@ class Thicket(GraphFrame):
         Returns:
             (bool): True if equal, False otherwise
         """
-        assert isinstance(other, Thicket)
+        if self is other:
+            return True
+        if not isinstance(other, Thicket):
+            return NotImplemented
         return (
             self.graph == other.graph
             and self.dataframe.equals(other.dataframe)
@@ -593,10 +596,11 @@ class Thicket(GraphFrame):
 
         # Maintain sets of connections to make for each old node.
         # Start with old -> new mapping and update as we traverse subgraphs.
-        connections = defaultdict(lambda: set())
+        connections = defaultdict(set)
         connections.update({k: {v} for k, v in old_to_new.items()})
 
         new_roots = []  # list of new roots
+        new_roots_set = set()  # for constant-time membership checks on new_roots
 
         # connect new nodes to children according to transitive
         # relationships in the old graph.
@@ -609,9 +613,10 @@ class Thicket(GraphFrame):
                         new_parent.add_child(n)
                         n.add_parent(new_parent)
 
-                elif n not in new_roots:
+                elif n not in new_roots_set:
                     # this is a new root
                     new_roots.append(n)
+                    new_roots_set.add(n)
 
             new_node = old_to_new.get(node)
             transitive = set()
@@ -1319,10 +1324,12 @@ class Thicket(GraphFrame):
                 # Metadata DataFrame
                 else:
                     row_idx = component.index
+                # Row index repeats each profile once per node, only scan unique ones
+                row_profs = set(row_idx)
                 profile_truth = [
                     prof
                     for prof in self.profile
-                    if any([row_prof in prof for row_prof in row_idx])
+                    if any(row_prof in prof for row_prof in row_profs)
                 ]
             # Option B: Non-columnar-indexed Thicket
             else:
@@ -1337,11 +1344,12 @@ class Thicket(GraphFrame):
         def _sync_indices(component, profile_truth):
             """Sync the Thicket attributes"""
             self.profile = profile_truth
+            profile_truth_set = set(profile_truth)
             self.profile_mapping = OrderedDict(
                 {
                     prof: file
                     for prof, file in self.profile_mapping.items()
-                    if prof in profile_truth
+                    if prof in profile_truth_set
                 }
             )
 
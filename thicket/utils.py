@@ -5,6 +5,7 @@
 
 from collections import OrderedDict, defaultdict
 
+import numpy as np
 import pandas as pd
 
 from thicket import helpers
@@ -68,13 +69,14 @@ def validate_dataframe(df):
 
     def _check_duplicate_inner_idx(df):
         """Check for duplicate values in the innermost indices."""
-        for node in set(df.index.get_level_values("node")):
-            inner_idx_values = sorted(df.loc[node].index.tolist())
-            inner_idx_values_set = sorted(list(set(inner_idx_values)))
-            if inner_idx_values != inner_idx_values_set:
-                raise DuplicateIndexError(
-                    f"Duplicate index {set(inner_idx_values)} found in DataFrame index."
-                )
+        # A node has duplicate inner indices exactly when the full index does
+        duplicated = df.index.duplicated()
+        if duplicated.any():
+            node = df.index.get_level_values("node")[duplicated.argmax()]
+            inner_idx_values = df.loc[node].index.tolist()
+            raise DuplicateIndexError(
+                f"Duplicate index {set(inner_idx_values)} found in DataFrame index."
+            )
 
     def _check_missing_hnid(df):
         """Check if there are missing hatchet nid's."""
@@ -89,14 +91,21 @@ def validate_dataframe(df):
 
     def _validate_name_column(df):
         """Check if all of the values in a node's name column are either its name or None."""
-        for node in set(df.index.get_level_values("node")):
-            names = set(df.loc[node]["name"].tolist())
-            node_name = node.frame["name"]
-            for name in names:
-                if name != node_name and name is not None:
-                    raise InvalidNameError(
-                        f"Value in the Thicket.dataframe's 'name' column is not valid. {name} != {node_name}"
-                    )
+        # Group rows by the integer codes of the "node" level rather than hashing
+        # (and looking up) every node object.
+        if isinstance(df.index, pd.MultiIndex):
+            level = df.index.names.index("node")
+            codes = df.index.codes[level]
+            nodes = df.index.levels[level]
+        else:
+            codes, nodes = pd.factorize(df.index)
+        node_names = np.array([node.frame["name"] for node in nodes], dtype=object)
+        names = df["name"].to_numpy(dtype=object)
+        for i in np.flatnonzero(names != node_names[codes]):
+            if names[i] is not None:
+                raise InvalidNameError(
+                    f"Value in the Thicket.dataframe's 'name' column is not valid. {names[i]} != {node_names[codes[i]]}"
+                )
 
     _check_duplicate_inner_idx(df)
     _check_missing_hnid(df)